@@ -24,9 +24,13 @@ from components.dashboard import render_dashboard
 # Streamlit page configuration
 # -----------------------------
 # Sets the browser tab title and uses full-width layout
+# (sidebar starts collapsed on the login screen)
 st.set_page_config(
     page_title="BPL Risk Management",
-    layout="wide"
+    layout="wide",
+    initial_sidebar_state=(
+        "expanded" if st.session_state.get('logged_in') else "collapsed"
+    )
 )
 
 # -----------------------------
@@ -48,6 +52,10 @@ if not st.session_state.get('logged_in', False):
     # login_page() is expected to handle authentication
     # and update st.session_state['logged_in']
 
+    # Never fall through to data loading / page rendering
+    # for an unauthenticated user
+    st.stop()
+
 
 # -----------------------------
 # Read user role / type
@@ -69,15 +77,6 @@ if user_type is None:
 # Personalized welcome message in the sidebar
 st.sidebar.title(f"👋 Welcome, {user_type.title()} Manager")
 
-# NOTE:
-# ⚠️ There are TWO selectboxes in this file.
-# The second one (below) overrides this selection.
-# This one is effectively unused.
-page = st.sidebar.selectbox(
-    "Select Page",
-    ["➕ Add Risk", "📉 Risk Burndown Dashboard"]
-)
-
 # Logout button in the sidebar
 # on_click triggers logout() which should clear session state
 st.sidebar.button("🚪 Logout", on_click=logout)
@@ -88,17 +87,19 @@ st.sidebar.button("🚪 Logout", on_click=logout)
 # -----------------------------
 # Loads the risk data once and passes it to pages
 # Typically returns a pandas DataFrame
+# (file parsing is cached across reruns inside load_data)
 df = load_data()
 
 
 # -----------------------------
-# Page navigation (ACTIVE)
+# Page navigation
 # -----------------------------
-# This selectbox actually controls the page rendering
-# (it overrides the earlier selectbox)
+# This selectbox controls the page rendering
+# (stable key keeps the selection across reruns)
 page = st.sidebar.selectbox(
     "Select Page",
-    ["Dashboard", "Add Risk"]  # Order can be changed if needed
+    ["Dashboard", "Add Risk"],  # Order can be changed if needed
+    key="active_page"
 )
 
 
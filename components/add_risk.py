@@ -2,10 +2,16 @@
 # Import required libraries & modules
 # ---------------------------------------
 import streamlit as st
+import numpy as np
 import pandas as pd
 
-# Data utilities for loading & saving risk data
-from utils.data import load_data, save_data
+# Data utilities for loading, standardizing & saving risk data
+from utils.data import (
+    load_data,
+    save_data,
+    standardize_columns,
+    downcast_categories
+)
 
 # Configuration options used for dropdowns & formatting
 from config.settings import (
@@ -13,12 +19,11 @@ from config.settings import (
     PROBABILITY_OPTIONS,
     IMPACT_OPTIONS,
     DIFFICULTY_OPTIONS,
-    PRIORITY_OPTIONS,
-    DATE_FORMAT
+    PRIORITY_OPTIONS
 )
 
-# Helper function for role-based data filtering
-from utils.helpers import filter_by_user_type
+# Helper functions for role-based filtering & table previews
+from utils.helpers import filter_by_user_type, preview_dataframe
 
 
 # ---------------------------------------
@@ -152,11 +157,11 @@ def render_add_risk(df):  # ✅ Entry point for Add Risk UI
                 new_row = {
                     'Risk ID': risk_id,
                     'Risk Description': risk_desc,
-                    'Risk Open Date': open_date.strftime(DATE_FORMAT),
-                    'Expected End Date (DD-MMM-YY)': expected_end.strftime(DATE_FORMAT),
+                    'Risk Open Date': pd.Timestamp(open_date),
+                    'Expected End Date (DD-MMM-YY)': pd.Timestamp(expected_end),
                     'Closure Date (DD-MMM-YY)': (
-                        closure_date.strftime(DATE_FORMAT)
-                        if closure_date else None
+                        pd.Timestamp(closure_date)
+                        if closure_date else pd.NaT
                     ),
                     'Risk Type': risk_type,
                     'Probability': probability,
@@ -167,11 +172,16 @@ def render_add_risk(df):  # ✅ Entry point for Add Risk UI
                     'Owner': owner
                 }
                 
-                # Append new record to DataFrame
-                df = pd.concat(
-                    [df, pd.DataFrame([new_row])],
-                    ignore_index=True
-                )
+                # Append the standardized record as a new frame
+                # (df may be the session's uploaded frame; the
+                # categoricals are re-cast over the combined values)
+                new_df = standardize_columns(pd.DataFrame([new_row]))
+                if df.empty:
+                    df = new_df
+                else:
+                    df = downcast_categories(
+                        pd.concat([df, new_df], ignore_index=True)
+                    )
 
                 # Update session data
                 st.session_state.uploaded_df = df
@@ -191,30 +201,24 @@ def render_add_risk(df):  # ✅ Entry point for Add Risk UI
     st.subheader("📄 Current Risks")
 
     if not filtered_df.empty:
-        # Display risk table
-        st.dataframe(
-            filtered_df,
-            use_container_width=True
-        )
+        # Display risk table (first rows only, expandable)
+        preview_dataframe(filtered_df, key="add_risk_preview")
+
+        # Summary metrics: open = no closure date,
+        # high = High / Critical priority
+        closure = filtered_df['Closure Date (DD-MMM-YY)'].to_numpy()
+        priority = filtered_df['Priority'].to_numpy()
+
+        open_cnt = int(pd.isna(closure).sum())
+        hi_cnt = int(np.isin(priority, ('High', 'Critical')).sum())
 
-        # Summary metrics
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total", len(filtered_df))
         with col2:
-            st.metric(
-                "Open",
-                filtered_df['Closure Date (DD-MMM-YY)'].isna().sum()
-            )
+            st.metric("Open", open_cnt)
         with col3:
-            st.metric(
-                "High Priority",
-                len(
-                    filtered_df[
-                        filtered_df['Priority'].isin(['High', 'Critical'])
-                    ]
-                )
-            )
+            st.metric("High Priority", hi_cnt)
     else:
         # No data message
         st.info("No risks yet!")
@@ -3,13 +3,135 @@
 # ---------------------------------------
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-# Data utilities
-from utils.data import load_data, save_data
+# Data utilities (load / save, date parsing)
+from utils.data import load_data, save_data, coerce_dates
 
-# Standard column schema
-from config.settings import ALL_STANDARD_COLUMNS
+# Standard column schema & date fields
+from config.settings import ALL_STANDARD_COLUMNS, DATE_COLUMNS
+
+# Burndown / monthly generators, plots & summary metrics
+# (int64 day arrays)
+from components.metrics import (
+    NAT_SENTINEL,
+    date_arrays,
+    generate_burndown,
+    generate_monthly_metrics,
+    plot_burndown,
+    plot_monthly_metrics,
+    render_summary
+)
+
+# Helpers: DataFrame cache key, table previews
+from utils.helpers import frame_key, preview_dataframe
+
+
+# Columns shown in the drill-down table
+PREVIEW_COLS = (
+    'Risk ID', 'Risk Description', 'Risk Type',
+    'Priority', 'Owner', 'Probability', 'Impact'
+)
+
+
+# ---------------------------------------
+# Dashboard inputs (cached)
+# ---------------------------------------
+@st.cache_data(
+    ttl=3600,
+    max_entries=8,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: frame_key}
+)
+def _prepare(df, user_type):
+    """
+    Turns the loaded risk data into the dashboard inputs
+    in one cached pass:
+
+    - Projects df onto ALL_STANDARD_COLUMNS (one reindex;
+      missing columns are filled with NaN)
+    - Parses any date column that is still unparsed
+    - Applies the role filter (tech users: Technical only)
+    - Splits the burndown views and converts their date
+      columns to int64 day arrays
+
+    Returns (df, views), with views as a list of
+    (tab title, data slice, day arrays, closed mask).
+    """
+    df = df.reindex(columns=ALL_STANDARD_COLUMNS)
+
+    # Parse any date column that is still unparsed (load_data()
+    # keeps unreadable dates as they are); NaT for the charts
+    for col in DATE_COLUMNS:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = coerce_dates(df[col])
+
+    technical = df[df['Risk Type'] == 'Technical']
+
+    # Tech users only see Technical risks, so only build the
+    # slices that will actually be rendered
+    if user_type == 'tech':
+        df = technical
+        views = [("🛠️ Technical Risks", technical)]
+    else:
+        views = [
+            ("🛠️ Technical Risks", technical),
+            ("🏢 All Risks", df)  # All risks for upper manager
+        ]
+
+    prepared = []
+    for title, df_part in views:
+        day_arrays = date_arrays(df_part)
+
+        # "Has a closure date", computed once per view and shared
+        # by the summary metrics and the drill-down
+        closed_mask = day_arrays[2] != NAT_SENTINEL
+
+        prepared.append((title, df_part, day_arrays, closed_mask))
+
+    return df, prepared
+
+
+# ---------------------------------------
+# Date-based drill-down (fragment)
+# ---------------------------------------
+@st.fragment
+def _date_details(timeline, title, df_part, day_arrays, closed_mask):
+    """
+    Lists the risks open on a selected date
+    of the burndown timeline.
+
+    Runs as a fragment: picking a new date only reruns
+    this block, not the burndown generators or charts.
+    """
+    selected_date = st.date_input(
+        "🔍 Select a specific date for risk details:",
+        value=pd.Timestamp(int(timeline[-1]), unit='D').date(),
+        key=f"drilldown_{title}"
+    )
+
+    selected_day = np.datetime64(selected_date, 'D').astype('int64')
+
+    # Open on the selected day: opened on/before it and
+    # not closed, or closed after it
+    opened, _, closed = day_arrays
+    open_mask = (
+        (opened != NAT_SENTINEL) &
+        (opened <= selected_day) &
+        (~closed_mask | (closed > selected_day))
+    )
+    open_idx = np.flatnonzero(open_mask)
+
+    if open_idx.size:
+        with st.expander(
+            f"📋 {open_idx.size} Open Risks on {selected_date}"
+        ):
+            # Open rows, drill-down columns only
+            preview_dataframe(
+                df_part.iloc[open_idx][list(PREVIEW_COLS)],
+                key=f"drilldown_preview_{title}"
+            )
 
 
 # ---------------------------------------
@@ -59,32 +181,10 @@ def render_dashboard(df):
 
     # Save current data to local Excel
     with col2:
-        if st.button("💾 Save Current Data to Local", use_container_width=True):
+        if st.button("💾 Save Current Data to Local", width="stretch"):
             save_data(df)
 
 
-    # ---------------------------------------
-    # Load active dataset based on source
-    # ---------------------------------------
-    if (
-        st.session_state.data_source == "local"
-        or st.session_state.uploaded_df is None
-    ):
-        df = load_data()
-    else:
-        df = st.session_state.uploaded_df.copy()
-
-
-    # ---------------------------------------
-    # Ensure schema consistency
-    # ---------------------------------------
-    for col in ALL_STANDARD_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-
-    df = df[ALL_STANDARD_COLUMNS]
-
-
     # ---------------------------------------
     # Empty data handling
     # ---------------------------------------
@@ -104,272 +204,60 @@ def render_dashboard(df):
 
 
     # ---------------------------------------
-    # Role-based filtering
+    # Schema, role filter & burndown views (cached)
     # ---------------------------------------
     # Tech users only see Technical risks
-    if st.session_state.user_type == 'tech':
-        df = df[df['Risk Type'] == 'Technical'].copy()
+    df, views = _prepare(df, st.session_state.user_type)
 
 
     # ---------------------------------------
     # Data preview
     # ---------------------------------------
     st.subheader("📄 Data Preview")
-    st.dataframe(df)
-
-
-    # ---------------------------------------
-    # Date conversion
-    # ---------------------------------------
-    try:
-        df['Expected End Date (DD-MMM-YY)'] = pd.to_datetime(
-            df['Expected End Date (DD-MMM-YY)'],
-            format="%d-%b-%y",
-            errors='coerce'
-        )
-        df['Closure Date (DD-MMM-YY)'] = pd.to_datetime(
-            df['Closure Date (DD-MMM-YY)'],
-            format="%d-%b-%y",
-            errors='coerce'
-        )
-        df['Risk Open Date'] = pd.to_datetime(
-            df['Risk Open Date'],
-            format="%d-%b-%y",
-            errors='coerce'
-        )
-    except:
-        st.error("❌ Date conversion failed. Ensure DD-MMM-YY format.")
-        st.stop()
-
-
-    # ---------------------------------------
-    # Split datasets
-    # ---------------------------------------
-    df_tech = df[df['Risk Type'] == 'Technical'].copy()
-    df_bus = df.copy()  # All risks for upper manager
-
-
-    # ---------------------------------------
-    # Daily burndown data generator
-    # ---------------------------------------
-    def generate_burndown(df_part):
-        """
-        Calculates expected vs actual open risks
-        for each day in the timeline.
-        """
-        if df_part.empty:
-            return None, None, None
-        
-        min_date = df_part['Risk Open Date'].min()
-        max_date = max(
-            df_part['Expected End Date (DD-MMM-YY)'].max(),
-            df_part['Closure Date (DD-MMM-YY)'].max()
-            if df_part['Closure Date (DD-MMM-YY)'].notna().any()
-            else df_part['Expected End Date (DD-MMM-YY)'].max()
-        )
-
-        timeline = pd.date_range(start=min_date, end=max_date, freq='D')
-
-        expected_counts = []
-        actual_counts = []
-
-        for current_date in timeline:
-            expected_open = df_part[
-                (df_part['Risk Open Date'] <= current_date) &
-                (df_part['Expected End Date (DD-MMM-YY)'] > current_date)
-            ].shape[0]
-
-            actual_open = df_part[
-                (df_part['Risk Open Date'] <= current_date) &
-                (
-                    df_part['Closure Date (DD-MMM-YY)'].isna() |
-                    (df_part['Closure Date (DD-MMM-YY)'] > current_date)
-                )
-            ].shape[0]
-
-            expected_counts.append(expected_open)
-            actual_counts.append(actual_open)
-
-        return timeline, expected_counts, actual_counts
+    preview_dataframe(df, key="dashboard_preview")
 
 
     # ---------------------------------------
-    # Burndown plotting (Plotly)
+    # Burndown rendering
     # ---------------------------------------
-    def plot_burndown(timeline, expected_counts, actual_counts, title, df_part=None):
-        """
-        Plots daily expected vs actual burndown,
-        highlights peak risk periods,
-        and allows date-based drill-down.
-        """
-        if timeline is None:
-            st.warning(f"No data available for {title}")
-            return
-
-        fig = go.Figure()
-
-        # Expected burndown
-        fig.add_trace(go.Scatter(
-            x=timeline,
-            y=expected_counts,
-            mode='lines+markers',
-            name='Expected Burndown',
-            line=dict(dash='dash', color='orange')
-        ))
-        fig.add_trace(go.Bar(
-            x=timeline,
-            y=expected_counts,
-            name='Expected Bar',
-            opacity=0.3
-        ))
-
-        # Actual burndown
-        fig.add_trace(go.Scatter(
-            x=timeline,
-            y=actual_counts,
-            mode='lines+markers',
-            name='Actual Burndown',
-            line=dict(color='green')
-        ))
-        fig.add_trace(go.Bar(
-            x=timeline,
-            y=actual_counts,
-            name='Actual Bar',
-            opacity=0.3
-        ))
-
-
-        # ---------------------------------------
-        # Peak risk detection (top 20%)
-        # ---------------------------------------
-        if actual_counts:
-            peak_threshold = max(actual_counts) * 0.8
-            peaks_indices = [
-                i for i, count in enumerate(actual_counts)
-                if count >= peak_threshold
-            ]
-
-            if peaks_indices:
-                peak_x = [timeline[i] for i in peaks_indices]
-                peak_y = [actual_counts[i] for i in peaks_indices]
-
-                fig.add_trace(go.Scatter(
-                    x=peak_x,
-                    y=peak_y,
-                    mode='markers',
-                    name='⚠️ Risk Peaks',
-                    marker=dict(
-                        color='red',
-                        size=15,
-                        symbol='star'
-                    )
-                ))
-
-        fig.update_layout(
-            title=title,
-            xaxis_title='Date',
-            yaxis_title='Number of Open Risks',
-            hovermode='x unified',
-            height=600,
-            template='plotly_white'
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-
-        # ---------------------------------------
-        # Date-based drill-down
-        # ---------------------------------------
-        selected_date = st.date_input(
-            "🔍 Select a specific date for risk details:",
-            value=timeline[-1].date()
-        )
+    # Daily and monthly generators are independent per view,
+    # so run them concurrently (the NumPy cores release the GIL)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            (
+                executor.submit(generate_burndown, *day_arrays),
+                executor.submit(generate_monthly_metrics, *day_arrays)
+            )
+            for _, _, day_arrays, _ in views
+        ]
+        results = [
+            (daily.result(), monthly.result())
+            for daily, monthly in futures
+        ]
+
+    tabs = st.tabs([title for title, _, _, _ in views])
+
+    for tab, (title, df_part, day_arrays, closed_mask), (daily, monthly) in zip(
+        tabs, views, results
+    ):
+        with tab:
+            render_summary(df_part, closed_mask)
 
-        selected_date_dt = pd.to_datetime(selected_date)
+            timeline, expected_counts, actual_counts = daily
+            chart_title = f"Daily Risk Burndown: {title}"
+            plot_burndown(timeline, expected_counts, actual_counts, chart_title)
 
-        if df_part is not None:
-            open_risks_on_date = df_part[
-                (df_part['Risk Open Date'] <= selected_date_dt) &
-                (
-                    df_part['Closure Date (DD-MMM-YY)'].isna() |
-                    (df_part['Closure Date (DD-MMM-YY)'] > selected_date_dt)
+            if timeline is not None and len(timeline):
+                _date_details(
+                    timeline, chart_title, df_part, day_arrays, closed_mask
                 )
-            ]
-
-            if not open_risks_on_date.empty:
-                with st.expander(
-                    f"📋 {len(open_risks_on_date)} Open Risks on {selected_date}"
-                ):
-                    st.dataframe(
-                        open_risks_on_date[
-                            ['Risk ID', 'Risk Description', 'Risk Type',
-                             'Priority', 'Owner', 'Probability', 'Impact']
-                        ]
-                    )
-
-
-    # ---------------------------------------
-    # Monthly metrics generator
-    # ---------------------------------------
-    def generate_monthly_metrics(df_part):
-        """
-        Calculates monthly:
-        - Risks opened
-        - Expected open risks
-        - Actual open risks
-        - Average RPM
-        """
-        if df_part.empty:
-            return None, None, None
-
-        df_part['YearMonth'] = df_part['Risk Open Date'].dt.to_period('M')
-        monthly_risks_opened = df_part.groupby('YearMonth').size()
-        avg_rpm = monthly_risks_opened.mean()
-
-        min_date = df_part['Risk Open Date'].min()
-        max_date = max(
-            df_part['Expected End Date (DD-MMM-YY)'].max(),
-            df_part['Closure Date (DD-MMM-YY)'].max()
-            if df_part['Closure Date (DD-MMM-YY)'].notna().any()
-            else df_part['Expected End Date (DD-MMM-YY)'].max()
-        )
-
-        monthly_timeline = pd.period_range(
-            start=min_date.to_period('M'),
-            end=max_date.to_period('M'),
-            freq='M'
-        )
-
-        monthly_expected_open = []
-        monthly_actual_open = []
-
-        for month in monthly_timeline:
-            month_end = (month + 1).to_timestamp() - pd.Timedelta(days=1)
-
-            expected_open = df_part[
-                (df_part['Risk Open Date'] <= month_end) &
-                (df_part['Expected End Date (DD-MMM-YY)'] > month_end)
-            ].shape[0]
 
-            actual_open = df_part[
-                (df_part['Risk Open Date'] <= month_end) &
-                (
-                    df_part['Closure Date (DD-MMM-YY)'].isna() |
-                    (df_part['Closure Date (DD-MMM-YY)'] > month_end)
+            monthly_timeline, monthly_rpm_df, avg_rpm = monthly
+            if monthly_rpm_df is not None:
+                st.subheader("📅 Monthly Metrics")
+                st.metric("Average Risks Opened / Month", f"{avg_rpm:.1f}")
+                plot_monthly_metrics(
+                    monthly_rpm_df,
+                    f"Monthly Risk Metrics: {title}"
                 )
-            ].shape[0]
-
-            monthly_expected_open.append(expected_open)
-            monthly_actual_open.append(actual_open)
-
-        monthly_rpm_df = pd.DataFrame({
-            'YearMonth': [str(m) for m in monthly_timeline],
-            'Risks Opened': monthly_risks_opened.reindex(
-                monthly_timeline,
-                fill_value=0
-            ).values,
-            'Expected Open Risks': monthly_expected_open,
-            'Actual Open Risks': monthly_actual_open
-        })
-
-        return monthly_timeline, monthly_rpm_df, avg_rpm
+                st.dataframe(monthly_rpm_df, width="stretch")
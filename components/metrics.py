@@ -1,142 +1,441 @@
 import streamlit as st
-import plotly.graph_objects as go
 import pandas as pd
-from utils.helpers import format_date
+import numpy as np
 
 
-def generate_burndown(df):
+# Sentinel day number for "never happens"
+_NEVER = np.iinfo(np.int64).max
+
+# Day number of NaT (datetime64 NaT viewed as int64)
+NAT_SENTINEL = np.iinfo(np.int64).min
+
+
+def date_arrays(df):
     """
-    Generate burndown chart data:
-    - timeline (date range)
-    - expected open risks per day
-    - actual open risks per day
+    Convert the parsed date columns to int64 day numbers,
+    once, as (opened, expected_end, closed).
+
+    Missing dates (NaT) become NAT_SENTINEL, so callers
+    can test `arr == NAT_SENTINEL`.
     """
+    return tuple(
+        df[col].values.astype('datetime64[D]').view('int64')
+        for col in (
+            'Risk Open Date',
+            'Expected End Date (DD-MMM-YY)',
+            'Closure Date (DD-MMM-YY)'
+        )
+    )
 
-    # Handle empty dataframe
-    if df.empty:
-        return None, None, None
 
-    # Convert relevant date columns to datetime
-    for col in [
-        'Risk Open Date',
-        'Expected End Date (DD-MMM-YY)',
-        'Closure Date (DD-MMM-YY)'
-    ]:
-        df[col] = pd.to_datetime(df[col], format="%d-%b-%y", errors='coerce')
-
-    # Determine timeline start and end dates
-    min_date = df['Risk Open Date'].min()
-
-    max_date = max(
-        df['Expected End Date (DD-MMM-YY)'].max(),
-        df['Closure Date (DD-MMM-YY)'].max()
-        or df['Expected End Date (DD-MMM-YY)'].max()
+def _sweep_open(starts, ends, first_day, n_days):
+    """
+    Count, for each day first_day .. first_day + n_days - 1,
+    the risks with start <= day < end.
+
+    All inputs are int64 day numbers. Difference array:
+    +1 on the start day, -1 on the end day, then one
+    cumulative sum over the timeline: O(N + T).
+    """
+    # A risk can never end before it starts
+    ends = np.maximum(ends, starts)
+
+    # Clip to the timeline before offsetting (sentinels stay
+    # in range); starts before it count from day 0, and
+    # n_days collects everything that happens after it
+    last = first_day + n_days
+    lo = np.clip(starts, first_day, last) - first_day
+    hi = np.clip(ends, first_day, last) - first_day
+
+    delta = (
+        np.bincount(lo, minlength=n_days + 1)
+        - np.bincount(hi, minlength=n_days + 1)
     )
 
-    # Create daily timeline
-    timeline = pd.date_range(start=min_date, end=max_date, freq='D')
-
-    expected_counts = []
-    actual_counts = []
-
-    # Calculate expected and actual open risks for each date
-    for date in timeline:
-
-        # Expected open risks:
-        # Opened on/before date AND expected end date is after current date
-        expected = df[
-            (df['Risk Open Date'] <= date) &
-            (df['Expected End Date (DD-MMM-YY)'] > date)
-        ].shape[0]
-
-        # Actual open risks:
-        # Opened on/before date AND either not closed or closed after current date
-        actual = df[
-            (df['Risk Open Date'] <= date) &
-            (
-                df['Closure Date (DD-MMM-YY)'].isna() |
-                (df['Closure Date (DD-MMM-YY)'] > date)
-            )
-        ].shape[0]
+    return np.cumsum(delta[:n_days])
 
-        expected_counts.append(expected)
-        actual_counts.append(actual)
 
-    return timeline, expected_counts, actual_counts
+def open_risk_curves(opened, expected_end, closed, first_day, n_days):
+    """
+    Expected and actual open risks for each of n_days
+    consecutive days from first_day, from int64 day
+    arrays (see date_arrays):
 
+    - expected open: opened <= day < expected end
+    - actual open:   opened <= day < closure (or never closed)
+    """
 
-def plot_burndown(timeline, expected, actual, title):
+    # Unparseable open date -> risk never opens
+    opened = np.where(opened == NAT_SENTINEL, _NEVER, opened)
+
+    # No expected end -> NAT_SENTINEL is below every open date,
+    # so the interval is empty and never counted as expected open
+
+    # No closure -> still open
+    closed = np.where(closed == NAT_SENTINEL, _NEVER, closed)
+
+    return (
+        _sweep_open(opened, expected_end, first_day, n_days),
+        _sweep_open(opened, closed, first_day, n_days)
+    )
+
+
+def lttb_indices(x, y, n_out):
     """
-    Plot burndown chart using Plotly
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most n_out points of (x, y)
+    that keep the visual shape of the line (first and last
+    points always kept). One NumPy pass per bucket.
     """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # n_out - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # Average of the next bucket (last point for the final one)
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Keep the point forming the largest triangle with
+        # the previously kept point and the next bucket average
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
 
-    # Handle missing data
-    if timeline is None:
-        st.warning("No data for chart")
-        return
+    return idx
 
-    fig = go.Figure()
 
-    # Expected burndown line (dashed)
-    fig.add_trace(
-        go.Scatter(
-            x=timeline,
-            y=expected,
-            mode='lines+markers',
-            name='Expected',
-            line=dict(dash='dash', color='orange')
-        )
+def _timeline_bounds(opened, expected_end, closed):
+    """
+    First open day and last expected end / closure
+    day of the burndown timeline (int64 day numbers).
+
+    NAT_SENTINEL is the smallest int64, so missing
+    end dates never win the max; missing open dates
+    are masked out of the min.
+
+    Returns None if no risk has an open date, or
+    none has an expected end / closure date.
+    """
+    valid_opened = opened[opened != NAT_SENTINEL]
+    if not valid_opened.size:
+        return None
+
+    max_day = max(
+        expected_end.max(initial=NAT_SENTINEL),
+        closed.max(initial=NAT_SENTINEL)
     )
+    if max_day == NAT_SENTINEL:
+        return None
 
-    # Actual burndown line
-    fig.add_trace(
-        go.Scatter(
-            x=timeline,
-            y=actual,
-            mode='lines+markers',
-            name='Actual',
-            line=dict(color='green')
-        )
+    return int(valid_opened.min()), int(max_day)
+
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def _compute_open_curves(opened, expected_end, closed):
+    """
+    Expected / actual open risks for every day from the
+    first open date to the end of the last timeline month.
+
+    Both the daily burndown (leading slice) and the
+    monthly metrics (month-end samples) read from these
+    curves, so the per-day sweep runs in one place.
+
+    Returns (days, expected_counts, actual_counts), with
+    days as int64 day numbers. Cached, so the two
+    generators share one computation per view.
+
+    Callers check _timeline_bounds() first (valid
+    open and end dates required).
+    """
+    min_day, max_day = _timeline_bounds(opened, expected_end, closed)
+
+    # Run to the last month end so every month-end sample
+    # is inside the curve
+    next_month = np.datetime64(max_day, 'D').astype('datetime64[M]') + 1
+    last_month_end = next_month.astype('datetime64[D]').astype('int64') - 1
+    days = np.arange(min_day, last_month_end + 1, dtype='int64')
+
+    expected_counts, actual_counts = open_risk_curves(
+        opened, expected_end, closed, min_day, len(days)
+    )
+
+    return days, expected_counts, actual_counts
+
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def generate_burndown(opened, expected_end, closed):
+    """
+    Calculates expected vs actual open risks
+    for each day in the timeline.
+
+    Returns (timeline_days, expected_counts, actual_counts),
+    with the timeline as int64 day numbers.
+
+    Takes the int64 day arrays from date_arrays();
+    cached on their content, so drill-down reruns
+    don't recompute the timeline.
+
+    Returns (None, None, None) if there are no open or
+    end dates, or every end date is before the first
+    open date (empty timeline).
+    """
+    bounds = _timeline_bounds(opened, expected_end, closed)
+    if bounds is None:
+        return None, None, None
+
+    min_day, max_day = bounds
+    n_days = max_day - min_day + 1
+    if n_days <= 0:
+        return None, None, None
+
+    # Daily view = leading slice of the shared open-risk curves;
+    # the timeline stays as int64 day numbers until plotting
+    days, expected_counts, actual_counts = _compute_open_curves(
+        opened, expected_end, closed
     )
 
-    # Layout configuration
+    return days[:n_days], expected_counts[:n_days], actual_counts[:n_days]
+
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def generate_monthly_metrics(opened, expected_end, closed):
+    """
+    Calculates monthly:
+    - Risks opened
+    - Expected open risks
+    - Actual open risks
+    - Average RPM
+
+    Takes the int64 day arrays from date_arrays()
+    (cached, see generate_burndown).
+
+    Returns (None, None, None) if there are no open or
+    end dates, or every end date is in a month before
+    the first open date.
+    """
+    bounds = _timeline_bounds(opened, expected_end, closed)
+    if bounds is None:
+        return None, None, None
+
+    min_day, max_day = bounds
+
+    # Month axis as datetime64[M] codes, first to last month
+    first_month = np.datetime64(min_day, 'D').astype('datetime64[M]')
+    last_month = np.datetime64(max_day, 'D').astype('datetime64[M]')
+    if last_month < first_month:
+        return None, None, None
+
+    month_codes = np.arange(first_month, last_month + 1)
+    monthly_timeline = pd.PeriodIndex(pd.DatetimeIndex(month_codes), freq='M')
+
+    # Count opens per calendar month: one bincount over month
+    # offsets from the first (= earliest open) month
+    open_months = (
+        opened[opened != NAT_SENTINEL]
+        .view('datetime64[D]')
+        .astype('datetime64[M]')
+    )
+    opens_per_month = np.bincount(
+        (open_months - first_month).astype('int64'),
+        minlength=len(month_codes)
+    )
+
+    # Average over the months that had at least one open
+    avg_rpm = opens_per_month[opens_per_month > 0].mean()
+
+    # Sample the shared daily curves at the last day of every month
+    month_end_days = (month_codes + 1).astype('datetime64[D]').astype('int64') - 1
+
+    days, expected_counts, actual_counts = _compute_open_curves(
+        opened, expected_end, closed
+    )
+    month_end_idx = np.searchsorted(days, month_end_days)
+
+    monthly_expected_open = expected_counts[month_end_idx]
+    monthly_actual_open = actual_counts[month_end_idx]
+
+    monthly_rpm_df = pd.DataFrame({
+        'YearMonth': np.datetime_as_string(month_codes, unit='M'),
+        'Risks Opened': opens_per_month[:len(month_codes)],
+        'Expected Open Risks': monthly_expected_open,
+        'Actual Open Risks': monthly_actual_open
+    })
+
+    return monthly_timeline, monthly_rpm_df, avg_rpm
+
+
+# Max points per plotted line (LTTB-downsampled above this)
+MAX_PLOT_POINTS = 1000
+
+
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
+def _build_fig(title, timeline_days, expected_counts, actual_counts):
+    """
+    Builds the daily burndown Plotly figure.
+
+    Arrays are hashed by content, so a figure is only
+    rebuilt when the burndown data or title changes.
+    Shared process-wide, so the cache is bounded
+    (oldest figures are evicted).
+    """
+    # Imported on first use (see plot_monthly_metrics)
+    import plotly.graph_objects as go
+
+    # Day numbers -> DatetimeIndex, once, at plot time
+    timeline = pd.to_datetime(timeline_days, unit='D')
+
+    # Long timelines: LTTB-downsample each line to at most
+    # MAX_PLOT_POINTS to keep the chart payload small
+    expected_idx = lttb_indices(timeline_days, expected_counts, MAX_PLOT_POINTS)
+    actual_idx = lttb_indices(timeline_days, actual_counts, MAX_PLOT_POINTS)
+
+    fig = go.Figure()
+
+    # Expected burndown (dashed line + shaded area)
+    fig.add_trace(go.Scattergl(
+        x=timeline[expected_idx],
+        y=expected_counts[expected_idx],
+        mode='lines',
+        name='Expected Burndown',
+        line=dict(dash='dash', color='orange'),
+        fill='tozeroy',
+        fillcolor='rgba(255, 165, 0, 0.3)'
+    ))
+
+    # Actual burndown (line + shaded area)
+    fig.add_trace(go.Scattergl(
+        x=timeline[actual_idx],
+        y=actual_counts[actual_idx],
+        mode='lines',
+        name='Actual Burndown',
+        line=dict(color='green'),
+        fill='tozeroy',
+        fillcolor='rgba(0, 128, 0, 0.3)'
+    ))
+
+
+    # ---------------------------------------
+    # Peak risk detection (top 20%)
+    # ---------------------------------------
+    if actual_counts.size:
+        # Peak days (actual >= 80% of the maximum)
+        peaks_idx = np.flatnonzero(actual_counts >= actual_counts.max() * 0.8)
+
+        # Long plateaus: downsample the markers like the lines
+        peaks_idx = peaks_idx[lttb_indices(
+            timeline_days[peaks_idx], actual_counts[peaks_idx], MAX_PLOT_POINTS
+        )]
+
+        if peaks_idx.size:
+            peak_x = timeline[peaks_idx]
+            peak_y = actual_counts[peaks_idx]
+
+            fig.add_trace(go.Scattergl(
+                x=peak_x,
+                y=peak_y,
+                mode='markers',
+                name='⚠️ Risk Peaks',
+                # Same values as the actual line; keep them
+                # out of the unified hover
+                hoverinfo='skip',
+                marker=dict(
+                    color='red',
+                    size=15,
+                    symbol='star'
+                )
+            ))
+
     fig.update_layout(
         title=title,
         xaxis_title='Date',
-        yaxis_title='Open Risks',
-        height=500,
-        template='plotly_white'
+        yaxis_title='Number of Open Risks',
+        hovermode='x unified',
+        height=600,
+        template='plotly_white',
+        # Keep zoom / WebGL state across reruns and tab switches
+        uirevision='burndown'
     )
 
-    # Render chart in Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def generate_monthly_metrics(df):
+def plot_burndown(timeline_days, expected_counts, actual_counts, title):
     """
-    Generate count of risks opened per month
+    Plot the daily burndown chart (timeline as int64
+    day numbers, see generate_burndown)
     """
 
-    # Create Year-Month column from Risk Open Date
-    df['YearMonth'] = pd.to_datetime(
-        df['Risk Open Date'],
-        format="%d-%b-%y"
-    ).dt.to_period('M')
+    # Handle missing data
+    if timeline_days is None:
+        st.warning(f"No data available for {title}")
+        return
+
+    # Figure is cached on the data and title
+    # (see _build_fig)
+    fig = _build_fig(
+        title,
+        timeline_days,
+        np.asarray(expected_counts),
+        np.asarray(actual_counts)
+    )
+
+    st.plotly_chart(fig, width="stretch")
+
 
-    # Group by month and count risks
-    return df.groupby('YearMonth').size()
+# Monthly bar colors (match the burndown lines)
+MONTHLY_COLORS = {
+    'Risks Opened': 'steelblue',
+    'Expected Open Risks': 'orange',
+    'Actual Open Risks': 'green'
+}
 
 
 def plot_monthly_metrics(monthly_data, title):
     """
-    Plot monthly risk count bar chart
+    Plot monthly risk metrics as a single bar trace
+
+    monthly_data is the wide frame from generate_monthly_metrics
+    (YearMonth column + one column per metric). Metrics are
+    melted to long form and drawn as one go.Bar on a
+    (month, metric) category axis, colored per bar.
     """
+    # Imported on first use: plotly is the heaviest import
+    # and isn't needed for the login page
+    import plotly.graph_objects as go
+
+    # Wide -> long, grouped by month (YYYY-MM sorts by date)
+    long = monthly_data.melt(
+        id_vars='YearMonth',
+        var_name='metric',
+        value_name='count'
+    ).sort_values('YearMonth', kind='stable')
 
     fig = go.Figure(
         data=[
             go.Bar(
-                x=monthly_data.index.astype(str),
-                y=monthly_data.values
+                x=[long['YearMonth'], long['metric']],
+                y=long['count'],
+                marker_color=long['metric'].map(MONTHLY_COLORS).fillna('gray')
             )
         ]
     )
@@ -144,31 +443,33 @@ def plot_monthly_metrics(monthly_data, title):
     fig.update_layout(
         title=title,
         xaxis_title='Month',
-        yaxis_title='Risks Opened'
+        yaxis_title='Risks'
     )
 
     # Render chart
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, width="stretch")
 
 
-def render_summary(df):
+def render_summary(df, closed_mask=None):
     """
     Render summary metrics (Total, Open, Closed)
+
+    closed_mask: optional precomputed boolean array
+    (risk has a closure date), shared with other callers
     """
 
+    if closed_mask is None:
+        closed_mask = df['Closure Date (DD-MMM-YY)'].notna().values
+
+    n_closed = int(np.count_nonzero(closed_mask))
+
     col1, col2, col3 = st.columns(3)
 
     with col1:
         st.metric("Total", len(df))
 
     with col2:
-        st.metric(
-            "Open",
-            df['Closure Date (DD-MMM-YY)'].isna().sum()
-        )
+        st.metric("Open", len(df) - n_closed)
 
     with col3:
-        st.metric(
-            "Closed",
-            df['Closure Date (DD-MMM-YY)'].notna().sum()
-        )
+        st.metric("Closed", n_closed)
@@ -1,12 +1,41 @@
 import os
+import tempfile
 
 EXCEL_FILE = r"E:\Code\BPL_Risk_Burndown\BPL_Risk_Structure\risks.xlsx"
 
+# Parquet copy of EXCEL_FILE (native dtypes, fast to load)
+SIDECAR_FILE = EXCEL_FILE + ".parquet"
+
+# Parsed copies of uploaded / local files (keyed by content hash)
+PARQUET_CACHE_DIR = os.path.join(tempfile.gettempdir(), "riskcache")
+
+# Most recently used parsed copies kept in PARQUET_CACHE_DIR
+PARQUET_CACHE_MAX_ENTRIES = 32
+
+# Login users: salt + scrypt digest of the password;
+# see utils.auth.hash_password for the KDF parameters
 USERS = {
-    'tech_manager': {'password': 'techpass', 'type': 'tech'},
-    'upper_manager': {'password': 'upperpass', 'type': 'upper'}
+    'tech_manager': {
+        'salt': bytes.fromhex('0b903938427326789cb06a472b2c2f58'),
+        'pw_hash': bytes.fromhex(
+            '4bc12f7d1c9234a219a0e3573b4d07ce'
+            '435f8cb45db3046268504735d69f644b'
+        ),
+        'type': 'tech'
+    },
+    'upper_manager': {
+        'salt': bytes.fromhex('cfbeb58b2f03043502acce08f989f31f'),
+        'pw_hash': bytes.fromhex(
+            '40c92661f4844b32c564c4f7a42a7eff'
+            '700c97bd9cdfb067efa19ef1a6f2c46b'
+        ),
+        'type': 'upper'
+    }
 }
 
+# Login dropdown options, built once
+USER_NAMES = tuple(USERS)
+
 ALL_STANDARD_COLUMNS = [
     'Risk ID', 'Risk Description', 'Risk Open Date', 
     'Expected End Date (DD-MMM-YY)', 'Closure Date (DD-MMM-YY)', 
@@ -14,6 +43,11 @@ ALL_STANDARD_COLUMNS = [
     'Priority', 'Action Plan', 'Owner'
 ]
 
+DATE_COLUMNS = [
+    'Risk Open Date', 'Expected End Date (DD-MMM-YY)',
+    'Closure Date (DD-MMM-YY)'
+]
+
 RISK_TYPE_OPTIONS = ['Quality', 'External', 'Cost', 'Technical']
 PROBABILITY_OPTIONS = ['Low', 'Medium', 'High', 'Very High']
 IMPACT_OPTIONS = ['Low', 'Medium', 'High', 'Very High']
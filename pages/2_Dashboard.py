@@ -1,5 +1,11 @@
+import streamlit as st
 from components.dashboard import render_dashboard
 from utils.data import load_data
 
+# Same login gate as app.py: pages are reachable by URL
+if not st.session_state.get('logged_in', False):
+    st.warning("🔐 Please login first.")
+    st.stop()
+
 df = load_data()
 render_dashboard(df)
\ No newline at end of file
@@ -0,0 +1,217 @@
+import io
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from config.settings import ALL_STANDARD_COLUMNS, DATE_COLUMNS
+from components.metrics import date_arrays, generate_burndown
+from utils import data
+from utils.data import standardize_columns, validate_columns
+
+
+def standardize(df):
+    """Validate + standardize, the way uploads are loaded."""
+    _, mapping, missing = validate_columns(df)
+    return standardize_columns(df, mapping), mapping, missing
+
+
+def test_variant_headers_are_mapped():
+    df = pd.DataFrame({
+        'ID': ['R1'],
+        'description': ['Vendor delay'],
+        'Open Date': ['05-Jan-24'],
+        'RISK TYPE': ['Technical']
+    })
+
+    result, mapping, _ = standardize(df)
+
+    assert mapping == {
+        'Risk ID': 'ID',
+        'Risk Description': 'description',
+        'Risk Open Date': 'Open Date',
+        'Risk Type': 'RISK TYPE'
+    }
+    assert list(result.columns) == ALL_STANDARD_COLUMNS
+    assert result.loc[0, 'Risk ID'] == 'R1'
+    assert result.loc[0, 'Risk Description'] == 'Vendor delay'
+    assert result.loc[0, 'Risk Open Date'] == pd.Timestamp('2024-01-05')
+    assert result.loc[0, 'Risk Type'] == 'Technical'
+
+
+def test_missing_columns_are_filled():
+    df = pd.DataFrame({'Risk ID': ['R1', 'R2']})
+
+    result, _, missing = standardize(df)
+
+    assert 'Owner' in missing
+    assert list(result.columns) == ALL_STANDARD_COLUMNS
+    assert result['Owner'].isna().all()
+    for col in DATE_COLUMNS:
+        assert pd.api.types.is_datetime64_any_dtype(result[col])
+        assert result[col].isna().all()
+
+
+def test_column_matched_by_several_standards_is_mirrored():
+    # 'Risk Description ID' matches both 'id' and 'description'
+    df = pd.DataFrame({'Risk Description ID': ['X']})
+
+    result, mapping, _ = standardize(df)
+
+    assert mapping['Risk ID'] == 'Risk Description ID'
+    assert mapping['Risk Description'] == 'Risk Description ID'
+    assert result.loc[0, 'Risk ID'] == 'X'
+    assert result.loc[0, 'Risk Description'] == 'X'
+
+
+def test_mapped_column_replaces_existing_standard_column():
+    # 'ID' comes first, so it wins 'Risk ID' over the exact name
+    df = pd.DataFrame({'ID': ['from ID'], 'Risk ID': ['from Risk ID']})
+
+    result, mapping, _ = standardize(df)
+
+    assert mapping['Risk ID'] == 'ID'
+    assert list(result.columns) == ALL_STANDARD_COLUMNS
+    assert result.loc[0, 'Risk ID'] == 'from ID'
+
+
+@pytest.mark.parametrize('value', ['Technical', 'Unlisted type'])
+def test_category_columns_keep_values(value):
+    result = standardize_columns(pd.DataFrame({'Risk Type': [value, None]}))
+
+    assert isinstance(result['Risk Type'].dtype, pd.CategoricalDtype)
+    assert result.loc[0, 'Risk Type'] == value
+    assert pd.isna(result.loc[1, 'Risk Type'])
+
+
+def test_upload_without_end_dates_has_no_burndown():
+    df = pd.DataFrame({
+        'Risk ID': ['R1', 'R2'],
+        'Risk Open Date': ['05-Jan-24', '10-Feb-24']
+    })
+
+    result, _, missing = standardize(df)
+
+    assert 'Expected End Date (DD-MMM-YY)' in missing
+    assert 'Closure Date (DD-MMM-YY)' in missing
+    assert generate_burndown(*date_arrays(result)) == (None, None, None)
+
+
+def join_exports():
+    """Wait for background Excel exports started by save_data."""
+    for thread in threading.enumerate():
+        if thread.name == 'excel-export':
+            thread.join()
+
+
+def risk_frame(n, risk_id=None):
+    """n standardized risks; risk_id overrides the last ID."""
+    ids = list(range(n))
+    if risk_id is not None:
+        ids[-1] = risk_id
+    return standardize_columns(pd.DataFrame({
+        'Risk ID': ids,
+        'Risk Open Date': ['05-Jan-24'] * n,
+        'Risk Type': ['Technical'] * n
+    }))
+
+
+def test_fallback_save_is_not_overwritten_by_older_export(tmp_path, monkeypatch):
+    excel_file = str(tmp_path / 'risks.xlsx')
+    monkeypatch.setattr(data, 'EXCEL_FILE', excel_file)
+    monkeypatch.setattr(data, 'SIDECAR_FILE', excel_file + '.parquet')
+
+    # Two parquet saves queue background exports; the third has a
+    # mixed int / str Risk ID column, so pyarrow rejects it and
+    # the Excel file is written in the foreground
+    data.save_data(risk_frame(2000))
+    data.save_data(risk_frame(2001))
+    data.save_data(risk_frame(2002, risk_id='NEW-1'))
+    join_exports()
+
+    saved = pd.read_excel(excel_file)
+    assert len(saved) == 2002
+    assert saved['Risk ID'].iloc[-1] == 'NEW-1'
+    assert not os.path.exists(data.SIDECAR_FILE)
+    assert data._export_error is None
+
+
+def test_unparseable_dates_are_kept():
+    df = pd.DataFrame({
+        'Risk ID': ['R1', 'R2', 'R3'],
+        'Risk Open Date': ['05-Jan-24', '2024-01-05', 'sometime in Q1'],
+        'Closure Date (DD-MMM-YY)': [None, 'TBD', '10-Feb-24']
+    })
+
+    result = standardize_columns(df)
+
+    # DD-MMM-YY and ISO dates are parsed, other values kept
+    assert result['Risk Open Date'].tolist()[:2] == [pd.Timestamp('2024-01-05')] * 2
+    assert result.loc[2, 'Risk Open Date'] == 'sometime in Q1'
+    assert result.loc[1, 'Closure Date (DD-MMM-YY)'] == 'TBD'
+
+    # ...and written back as they were
+    written = data.format_dates(result.copy())
+    assert written['Risk Open Date'].tolist() == ['05-Jan-24', '05-Jan-24', 'sometime in Q1']
+    assert written['Closure Date (DD-MMM-YY)'].tolist()[1:] == ['TBD', '10-Feb-24']
+    assert pd.isna(written.loc[0, 'Closure Date (DD-MMM-YY)'])
+
+
+def test_unparseable_dates_survive_a_save(tmp_path, monkeypatch):
+    excel_file = str(tmp_path / 'risks.xlsx')
+    monkeypatch.setattr(data, 'EXCEL_FILE', excel_file)
+    monkeypatch.setattr(data, 'SIDECAR_FILE', excel_file + '.parquet')
+
+    data.save_data(standardize_columns(pd.DataFrame({
+        'Risk ID': ['R1', 'R2'],
+        'Risk Open Date': ['05-Jan-24', 'TBD']
+    })))
+    join_exports()
+
+    saved = pd.read_excel(excel_file)
+    assert saved['Risk Open Date'].tolist() == ['05-Jan-24', 'TBD']
+
+
+def test_corrupt_workbook_raises_value_error():
+    with pytest.raises(ValueError, match='Unreadable Excel file'):
+        data._read_excel(io.BytesIO(b'not an excel file'))
+
+
+def test_other_excel_errors_propagate(monkeypatch):
+    def broken_read_excel(*args, **kwargs):
+        raise RuntimeError('bug in the reader')
+
+    monkeypatch.setattr(data.pd, 'read_excel', broken_read_excel)
+
+    with pytest.raises(RuntimeError, match='bug in the reader'):
+        data._read_excel(io.BytesIO(b''))
+
+
+def csv_bytes(n):
+    """CSV file with n risks."""
+    return pd.DataFrame({'Risk ID': range(n)}).to_csv(index=False).encode()
+
+
+def test_parquet_cache_is_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, 'PARQUET_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(data, 'PARQUET_CACHE_MAX_ENTRIES', 3)
+
+    for n in range(1, 6):
+        assert len(data._read_table('risks.csv', csv_bytes(n))) == n
+
+    assert len(list(tmp_path.glob('*.parquet'))) == 3
+
+    # The newest entry is still served from the cache
+    assert len(data._read_table('risks.csv', csv_bytes(5))) == 5
+    assert len(list(tmp_path.glob('*.parquet'))) == 3
+
+
+def test_parquet_cache_key_includes_parser_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, 'PARQUET_CACHE_DIR', str(tmp_path))
+
+    data._read_table('risks.csv', csv_bytes(2))
+    monkeypatch.setattr(data, '_PARSER_VERSION', data._PARSER_VERSION + 1)
+    data._read_table('risks.csv', csv_bytes(2))
+
+    assert len(list(tmp_path.glob('*.parquet'))) == 2
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.metrics import (
+    date_arrays,
+    generate_burndown,
+    generate_monthly_metrics,
+    lttb_indices
+)
+
+
+OPEN = 'Risk Open Date'
+END = 'Expected End Date (DD-MMM-YY)'
+CLOSED = 'Closure Date (DD-MMM-YY)'
+
+
+def make_frame(opened, expected_end, closed):
+    """Risk frame with just the three date columns."""
+    return pd.DataFrame({
+        OPEN: pd.to_datetime(pd.Series(opened, dtype=object)),
+        END: pd.to_datetime(pd.Series(expected_end, dtype=object)),
+        CLOSED: pd.to_datetime(pd.Series(closed, dtype=object))
+    })
+
+
+def random_frame(rng):
+    """Random risks over ~10 months, with NaT in every column."""
+    n = int(rng.integers(1, 40))
+    base = pd.Timestamp('2023-01-01')
+
+    def dates(high, keep):
+        values = pd.Series(base + pd.to_timedelta(rng.integers(0, high, n), 'D'))
+        return values.where(rng.random(n) < keep)
+
+    return pd.DataFrame({
+        OPEN: dates(300, 0.9),
+        END: dates(250, 0.9),
+        CLOSED: dates(250, 0.5)
+    })
+
+
+def reference_burndown(df):
+    """Day-by-day loop over the frame (the original algorithm)."""
+    ends = pd.concat([df[END], df[CLOSED]]).dropna()
+    if df[OPEN].isna().all() or ends.empty:
+        return None
+
+    timeline = pd.date_range(df[OPEN].min(), ends.max(), freq='D')
+    if timeline.empty:
+        return None
+
+    expected = [
+        int(((df[OPEN] <= day) & (df[END] > day)).sum())
+        for day in timeline
+    ]
+    actual = [
+        int(((df[OPEN] <= day) & (df[CLOSED].isna() | (df[CLOSED] > day))).sum())
+        for day in timeline
+    ]
+    return timeline, expected, actual
+
+
+def reference_monthly(df):
+    """Per-month groupby + month-end counts (the original algorithm)."""
+    ends = pd.concat([df[END], df[CLOSED]]).dropna()
+    if df[OPEN].isna().all() or ends.empty:
+        return None
+
+    months = pd.period_range(
+        df[OPEN].min().to_period('M'), ends.max().to_period('M'), freq='M'
+    )
+    if months.empty:
+        return None
+
+    opened = df[OPEN].dt.to_period('M').value_counts()
+
+    rows = []
+    for month in months:
+        month_end = month.to_timestamp(how='end').normalize()
+        rows.append((
+            str(month),
+            int(opened.get(month, 0)),
+            int(((df[OPEN] <= month_end) & (df[END] > month_end)).sum()),
+            int((
+                (df[OPEN] <= month_end)
+                & (df[CLOSED].isna() | (df[CLOSED] > month_end))
+            ).sum())
+        ))
+
+    return rows, df.groupby(df[OPEN].dt.to_period('M')).size().mean()
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_burndown_matches_reference(seed):
+    df = random_frame(np.random.default_rng(seed))
+    expected = reference_burndown(df)
+
+    timeline_days, expected_counts, actual_counts = generate_burndown(
+        *date_arrays(df)
+    )
+
+    if expected is None:
+        assert timeline_days is None
+        return
+
+    timeline, ref_expected, ref_actual = expected
+    assert list(pd.to_datetime(timeline_days, unit='D')) == list(timeline)
+    assert list(expected_counts) == ref_expected
+    assert list(actual_counts) == ref_actual
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_monthly_metrics_match_reference(seed):
+    df = random_frame(np.random.default_rng(seed))
+    expected = generate_monthly_metrics(*date_arrays(df))
+    reference = reference_monthly(df)
+
+    if reference is None:
+        assert expected == (None, None, None)
+        return
+
+    rows, avg_rpm = reference
+    _, monthly_df, result_avg = expected
+    assert list(monthly_df.itertuples(index=False, name=None)) == rows
+    assert result_avg == pytest.approx(avg_rpm)
+
+
+@pytest.mark.parametrize('opened, expected_end, closed', [
+    # No expected end / closure dates at all
+    (['2024-01-05', '2024-02-01'], [None, None], [None, None]),
+    # No parseable open date
+    ([None], ['2024-01-01'], [None]),
+    # Every end date before the first open date
+    (['2024-03-05'], ['2024-01-01'], ['2024-01-02']),
+    # No rows
+    ([], [], [])
+])
+def test_degenerate_timelines_have_no_burndown(opened, expected_end, closed):
+    arrays = date_arrays(make_frame(opened, expected_end, closed))
+    assert generate_burndown(*arrays) == (None, None, None)
+
+
+def test_monthly_metrics_without_end_dates():
+    arrays = date_arrays(make_frame(['2024-01-05'], [None], [None]))
+    assert generate_monthly_metrics(*arrays) == (None, None, None)
+
+
+def test_lttb_keeps_endpoints_and_caps_points():
+    x = np.arange(5000)
+    y = np.sin(x / 100.0)
+
+    idx = lttb_indices(x, y, 100)
+
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_short_series_unchanged():
+    assert list(lttb_indices(np.arange(10), np.arange(10), 100)) == list(range(10))
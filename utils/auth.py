@@ -1,16 +1,44 @@
 # ---------------------------------------
 # Import required libraries
 # ---------------------------------------
+import os
+import hmac
+import hashlib
 import streamlit as st
 
 # USERS dictionary contains:
 # {
 #   "username": {
-#       "password": "xxxx",
+#       "salt": b"...",
+#       "pw_hash": b"...",   # hash_password(password, salt)
 #       "type": "Admin/User"
 #   }
 # }
-from config.settings import USERS
+from config.settings import USERS, USER_NAMES
+
+
+# ---------------------------------------
+# Password hashing
+# ---------------------------------------
+def hash_password(password, salt):
+    """Salted scrypt digest of a password (memory-hard KDF)."""
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=2 ** 14,
+        r=8,
+        p=1,
+        dklen=32
+    )
+
+
+# Checked instead of a real entry for unknown usernames,
+# so a failed login costs the same either way (random
+# digest: no password matches it)
+_DUMMY_ENTRY = {
+    'salt': os.urandom(16),
+    'pw_hash': os.urandom(32)
+}
 
 
 # ---------------------------------------
@@ -47,20 +75,11 @@ def init_auth():
 def login_page():
     """
     Renders the login page and authenticates the user.
-    Sidebar is hidden to prevent navigation before login.
+    Nothing is rendered into the sidebar and page
+    navigation is off (.streamlit/config.toml), so
+    there is no sidebar before login.
     """
 
-    # Hide sidebar completely on login screen
-    st.markdown(
-        "<style>[data-testid='stSidebar'] {display: none !important;}</style>",
-        unsafe_allow_html=True
-    )
-    
-    # Centered container for login UI
-    st.markdown("""
-    <div style='text-align: center; padding: 4rem 2rem;'>
-    """, unsafe_allow_html=True)
-    
     # App title
     st.title("🔐 BPL Risk Management System")
     st.markdown("***Please login to continue***")
@@ -73,7 +92,7 @@ def login_page():
         # Dropdown to select a predefined user
         username = st.selectbox(
             "**Select User**",
-            options=list(USERS.keys()),
+            options=USER_NAMES,
             index=0
         )
 
@@ -86,11 +105,19 @@ def login_page():
         # Login button
         if st.button(
             "✅ **LOGIN**",
-            use_container_width=True,
+            width="stretch",
             type="primary"
         ):
-            # Validate credentials
-            if username in USERS and USERS[username]['password'] == password:
+            # Validate credentials (constant-time hash compare;
+            # unknown users are hashed against a dummy entry)
+            entry = USERS.get(username)
+            candidate = entry or _DUMMY_ENTRY
+            password_ok = hmac.compare_digest(
+                candidate['pw_hash'],
+                hash_password(password, candidate['salt'])
+            )
+
+            if entry and password_ok:
                 
                 # Update session state on successful login
                 st.session_state['logged_in'] = True
@@ -106,9 +133,6 @@ def login_page():
             else:
                 # Error message on failed login
                 st.error("❌ **Invalid username or password!**")
-    
-    # Close HTML wrapper
-    st.markdown("</div>", unsafe_allow_html=True)
 
     # Stop further execution so main app does not load
     st.stop()
@@ -119,13 +143,13 @@ def login_page():
 # ---------------------------------------
 def logout():
     """
-    Logs out the user by clearing all session state
-    and reloading the app.
+    Logs out the user by clearing all session state.
+
+    Used as the Logout button's on_click callback:
+    Streamlit reruns the app after the callback, which
+    shows the login page again (st.rerun() is a no-op
+    inside callbacks).
     """
 
     # Remove all keys from session_state
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
-
-    # Reload app to show login page again
-    st.rerun()
+    st.session_state.clear()
@@ -1,71 +1,153 @@
 # ---------------------------------------
 # Import required libraries
 # ---------------------------------------
+import io
+import re
+import logging
+import hashlib
+import tempfile
+import zipfile
+import time
+import threading
+import functools
 import pandas as pd
 import streamlit as st
 import os
 
 # Application-level configuration:
 # - EXCEL_FILE: path where risk data is stored locally
+# - SIDECAR_FILE: parquet copy of it, written on save
 # - ALL_STANDARD_COLUMNS: canonical column order used across the app
-from config.settings import EXCEL_FILE, ALL_STANDARD_COLUMNS
+# - DATE_COLUMNS / DATE_FORMAT: date fields and their DD-MMM-YY format
+# - PARQUET_CACHE_DIR / PARQUET_CACHE_MAX_ENTRIES: where parsed files
+#   are cached as parquet, and how many are kept
+# - *_OPTIONS: allowed values of the categorical risk fields
+from config.settings import (
+    EXCEL_FILE,
+    SIDECAR_FILE,
+    PARQUET_CACHE_DIR,
+    PARQUET_CACHE_MAX_ENTRIES,
+    ALL_STANDARD_COLUMNS,
+    DATE_COLUMNS,
+    DATE_FORMAT,
+    RISK_TYPE_OPTIONS,
+    PROBABILITY_OPTIONS,
+    IMPACT_OPTIONS,
+    DIFFICULTY_OPTIONS,
+    PRIORITY_OPTIONS
+)
+
+
+# Low-cardinality columns stored as categoricals
+# -> {column: allowed options}
+CATEGORY_OPTIONS = {
+    'Risk Type': RISK_TYPE_OPTIONS,
+    'Probability': PROBABILITY_OPTIONS,
+    'Impact': IMPACT_OPTIONS,
+    'Difficulty': DIFFICULTY_OPTIONS,
+    'Priority': PRIORITY_OPTIONS,
+    # Free text, but few distinct owners: categories are
+    # just the values present
+    'Owner': ()
+}
+
+
+# Seconds to wait before retrying a failed local read
+LOAD_RETRY_DELAY = 1.0
+
+
+# Mapping of standard column names to possible variations
+REQUIRED_MAPPING = {
+    'Risk ID': ['Risk ID', 'risk_id', 'ID'],
+    'Risk Description': ['Risk Description', 'Description'],
+    'Risk Open Date': ['Risk Open Date', 'Open Date'],
+    'Expected End Date (DD-MMM-YY)': ['Expected End Date'],
+    'Closure Date (DD-MMM-YY)': ['Closure Date'],
+    'Risk Type': ['Risk Type', 'Type'],
+    'Probability': ['Probability'],
+    'Impact': ['Impact'],
+    'Difficulty': ['Difficulty'],
+    'Priority': ['Priority'],
+    'Action Plan': ['Action Plan'],
+    'Owner': ['Owner']
+}
+
+# One compiled alternation of the lower-cased variants per
+# standard column (matching is case-insensitive, partial)
+REQUIRED_PATTERNS = {
+    standard: re.compile('|'.join(re.escape(p.lower()) for p in possibles))
+    for standard, possibles in REQUIRED_MAPPING.items()
+}
+
+
+def _is_schema_column(col):
+    """
+    usecols filter for the file readers: keeps only columns
+    that match a standard column's variants (everything
+    else is dropped by standardize_columns anyway).
+    """
+    low = str(col).lower()
+    return any(pattern.search(low) for pattern in REQUIRED_PATTERNS.values())
 
 
 # ---------------------------------------
 # Validate uploaded file columns
 # ---------------------------------------
-def validate_columns(df):
+@functools.lru_cache(maxsize=32)
+def _match_columns(columns):
     """
-    Validates whether the uploaded DataFrame contains
-    all required risk-related columns.
+    Matches a tuple of column names against
+    REQUIRED_PATTERNS.
 
-    Supports flexible column naming by matching
-    possible variations of each standard column.
+    Memoized on the header itself, so re-uploads with
+    the same columns skip the regex scan.
     """
 
-    # Mapping of standard column names to possible variations
-    required_mapping = {
-        'Risk ID': ['Risk ID', 'risk_id', 'ID'],
-        'Risk Description': ['Risk Description', 'Description'],
-        'Risk Open Date': ['Risk Open Date', 'Open Date'],
-        'Expected End Date (DD-MMM-YY)': ['Expected End Date'],
-        'Closure Date (DD-MMM-YY)': ['Closure Date'],
-        'Risk Type': ['Risk Type', 'Type'],
-        'Probability': ['Probability'],
-        'Impact': ['Impact'],
-        'Difficulty': ['Difficulty'],
-        'Priority': ['Priority'],
-        'Action Plan': ['Action Plan'],
-        'Owner': ['Owner']
-    }
-    
     # Stores mapping: {standard_column: actual_column_in_file}
     column_mapping = {}
 
     # List of missing required standard columns
     missing = []
-    
+
+    # Lower-cased column names, for matching
+    lowered = [str(col).lower() for col in columns]
+
     # Loop through each standard column definition
-    for standard, possibles in required_mapping.items():
-        found = False
-
-        # Check against all columns in uploaded DataFrame
-        for col in df.columns:
-            # Case-insensitive partial match
-            if any(p.lower() in col.lower() for p in possibles):
-                column_mapping[standard] = col
-                found = True
-                break
-
-        # Track missing columns
-        if not found:
+    for standard, pattern in REQUIRED_PATTERNS.items():
+        # First column with a case-insensitive partial match
+        match = next(
+            (
+                col for col, low in zip(columns, lowered)
+                if pattern.search(low)
+            ),
+            None
+        )
+
+        if match is not None:
+            column_mapping[standard] = match
+        else:
+            # Track missing columns
             missing.append(standard)
-    
+
+    return column_mapping, missing
+
+
+def validate_columns(df):
+    """
+    Validates whether the uploaded DataFrame contains
+    all required risk-related columns.
+
+    Supports flexible column naming by matching
+    possible variations of each standard column.
+    """
+    column_mapping, missing = _match_columns(tuple(df.columns))
+
     # Return:
     # - Whether all required columns exist
     # - Mapping from standard → actual column
     # - List of missing columns
-    return len(missing) == 0, column_mapping, missing
+    # (copies, so callers can't modify the cached result)
+    return len(missing) == 0, dict(column_mapping), list(missing)
 
 
 # ---------------------------------------
@@ -76,28 +158,318 @@ def standardize_columns(df, column_mapping=None):
     Converts input DataFrame into a standardized format
     using ALL_STANDARD_COLUMNS.
 
-    - Renames/mirrors detected columns
-    - Adds missing columns as None
+    - Renames detected columns (one rename, no copies)
+    - Adds missing columns as NaN
     - Ensures consistent column order
+    - Stores CATEGORY_OPTIONS columns as categoricals
+    - Parses DATE_COLUMNS to datetime64 (parse_dates)
     """
 
-    # Work on a copy to avoid mutating original DataFrame
-    df = df.copy()
-
     # If column mapping exists (from uploaded file),
-    # copy actual column values into standard columns
-    if column_mapping:
-        for standard, actual in column_mapping.items():
-            if actual in df.columns:
-                df[standard] = df[actual]
-    
-    # Ensure all standard columns exist
-    for col in ALL_STANDARD_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-    
-    # Return DataFrame with strict column order
-    return df[ALL_STANDARD_COLUMNS]
+    # rename each actual column to its standard name
+    renames = {}   # actual column -> standard name
+    mirrors = {}   # standard name -> standard it duplicates
+
+    for standard, actual in (column_mapping or {}).items():
+        if actual not in df.columns:
+            continue
+
+        # A column matched by several standards is renamed
+        # once and mirrored into the others below
+        if actual in renames:
+            mirrors[standard] = renames[actual]
+        else:
+            renames[actual] = standard
+
+    # Existing columns that already carry a rename target
+    # are replaced by the mapped column
+    replaced = [
+        standard for standard in renames.values()
+        if standard in df.columns and standard not in renames
+    ]
+
+    # Rename, then project onto the standard column order
+    # (missing columns become NaN)
+    df = df.drop(columns=replaced).rename(columns=renames)
+    df = df.reindex(columns=ALL_STANDARD_COLUMNS)
+
+    # Columns matched by several standards: copy into the others
+    if mirrors:
+        df = df.assign(**{
+            standard: df[source] for standard, source in mirrors.items()
+        })
+
+    # Low-cardinality text columns as categoricals,
+    # date strings as datetime64
+    return parse_dates(downcast_categories(df))
+
+
+# ---------------------------------------
+# Date column parsing / formatting
+# ---------------------------------------
+def coerce_dates(values):
+    """
+    Series of dates -> datetime64: DD-MMM-YY first,
+    ISO 8601 (e.g. 2024-01-05) for the rest.
+    Values neither format can read become NaT.
+    """
+    parsed = pd.to_datetime(values, format=DATE_FORMAT, errors='coerce', cache=True)
+
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed.loc[retry] = pd.to_datetime(
+            values[retry], format='ISO8601', errors='coerce'
+        )
+
+    return parsed
+
+
+def parse_dates(df):
+    """
+    Parses DATE_COLUMNS to datetime64 (see coerce_dates).
+
+    Done once in standardize_columns, so downstream code
+    can compare dates without re-parsing strings.
+
+    A column with values that can't be parsed stays
+    object: those cells keep their original value, so
+    saving writes them back unchanged (the dashboard
+    treats them as missing dates).
+    """
+    try:
+        for col in DATE_COLUMNS:
+            raw = df[col]
+            parsed = coerce_dates(raw)
+
+            unparsed = parsed.isna() & raw.notna()
+            if unparsed.any():
+                df[col] = parsed.astype(object).where(~unparsed, raw)
+            else:
+                df[col] = parsed
+    except (ValueError, TypeError) as e:
+        st.error(f"❌ Date conversion failed. Ensure DD-MMM-YY format. ({e})")
+
+    return df
+
+
+def format_dates(df):
+    """
+    Formats DATE_COLUMNS back to DD-MMM-YY strings
+    (the on-disk format of the local Excel file).
+    Unparseable values are written as they are.
+    """
+    for col in DATE_COLUMNS:
+        parsed = coerce_dates(df[col])
+        df[col] = parsed.dt.strftime(DATE_FORMAT).where(parsed.notna(), df[col])
+
+    return df
+
+
+# ---------------------------------------
+# Categorical dtypes
+# ---------------------------------------
+def downcast_categories(df):
+    """
+    Casts CATEGORY_OPTIONS columns to CategoricalDtype.
+
+    Values outside the configured options are kept
+    as extra categories, so no data is lost.
+    Returns a new frame.
+    """
+    dtypes = {}
+    for col, options in CATEGORY_OPTIONS.items():
+        extra = sorted(set(df[col].dropna().unique()) - set(options), key=str)
+        dtypes[col] = pd.CategoricalDtype(list(options) + extra)
+
+    return df.astype(dtypes)
+
+
+# ---------------------------------------
+# Excel reader
+# ---------------------------------------
+# Errors the Excel engines raise for a file that isn't a
+# readable workbook (engines that aren't installed are skipped)
+_EXCEL_PARSE_ERRORS = [zipfile.BadZipFile]
+
+try:
+    from python_calamine import CalamineError
+    _EXCEL_PARSE_ERRORS.append(CalamineError)
+except ImportError:
+    pass
+
+try:
+    from openpyxl.utils.exceptions import InvalidFileException
+    _EXCEL_PARSE_ERRORS.append(InvalidFileException)
+except ImportError:
+    pass
+
+_EXCEL_PARSE_ERRORS = tuple(_EXCEL_PARSE_ERRORS)
+
+
+def _read_excel(buffer):
+    """
+    Reads an Excel workbook with the calamine engine
+    (Rust reader), falling back to pandas' default
+    engine if python-calamine is not installed.
+    Only schema columns are loaded.
+
+    Parse errors of the engines (_EXCEL_PARSE_ERRORS)
+    are raised as ValueError; anything else propagates.
+    """
+    try:
+        try:
+            return pd.read_excel(
+                buffer, engine="calamine", usecols=_is_schema_column
+            )
+        except ImportError:
+            buffer.seek(0)
+            return pd.read_excel(buffer, usecols=_is_schema_column)
+    except _EXCEL_PARSE_ERRORS as e:
+        raise ValueError(f"Unreadable Excel file: {e}") from e
+
+
+# ---------------------------------------
+# Persistent parquet cache
+# ---------------------------------------
+# Part of the cache key: bump when the parse options
+# (engine, usecols, ...) change, so older entries are
+# no longer served
+_PARSER_VERSION = 2
+
+
+def _prune_parquet_cache():
+    """
+    Keeps the PARQUET_CACHE_MAX_ENTRIES most recently
+    used entries of PARQUET_CACHE_DIR; older ones are
+    deleted (best-effort).
+    """
+    entries = []
+    for entry in os.scandir(PARQUET_CACHE_DIR):
+        if entry.name.endswith('.parquet'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+
+    entries.sort(reverse=True)
+    for _, path in entries[PARQUET_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _read_table(name, data):
+    """
+    Parses CSV / Excel / parquet bytes into a DataFrame.
+
+    The parsed frame is kept as parquet under
+    PARQUET_CACHE_DIR (keyed by SHA-256 of the parser
+    version, file kind and bytes), so the same file is
+    only parsed once per machine. The directory is
+    pruned to PARQUET_CACHE_MAX_ENTRIES on every write.
+    """
+    # Already columnar (local sidecar): nothing to cache
+    if name.endswith('.parquet'):
+        return pd.read_parquet(io.BytesIO(data))
+
+    kind = 'excel' if name.endswith(('.xlsx', '.xls')) else 'csv'
+
+    key = hashlib.sha256(f"{_PARSER_VERSION}:{kind}:".encode())
+    key.update(data)
+    cache_path = os.path.join(PARQUET_CACHE_DIR, f"{key.hexdigest()}.parquet")
+
+    # Cache hit: read the parsed frame back (and mark
+    # the entry as recently used for pruning)
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            os.utime(cache_path)
+            return df
+        except Exception:
+            # Unreadable cache entry → fall back to parsing
+            pass
+
+    buffer = io.BytesIO(data)
+
+    if kind == 'excel':
+        df = _read_excel(buffer)
+    else:
+        df = pd.read_csv(buffer, usecols=_is_schema_column)
+
+    # Best-effort cache write (temp file + rename, so readers
+    # never see a partial file). Skipped if pyarrow is missing
+    # or a column can't be stored as parquet.
+    try:
+        os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=PARQUET_CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        _prune_parquet_cache()
+    except Exception:
+        pass
+
+    return df
+
+
+# ---------------------------------------
+# Cached file readers
+# ---------------------------------------
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_uploaded(file_id, name, _data):
+    """
+    Parses and standardizes an uploaded CSV / Excel file.
+
+    Cached on Streamlit's per-upload file_id (the raw
+    bytes are not hashed), so reruns with the same
+    upload skip parsing and standardization entirely.
+
+    Returns (df, missing_columns).
+    """
+    df = _read_table(name, _data)
+
+    # Validate uploaded file columns
+    _, mapping, missing = validate_columns(df)
+
+    return standardize_columns(df, mapping), missing
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_local(path, mtime_ns, size):
+    """
+    Reads and standardizes the local risk data
+    (Excel file or its parquet sidecar).
+
+    (mtime_ns, size) is part of the cache key, so an
+    updated file on disk is re-read on the next rerun.
+    """
+    with open(path, 'rb') as f:
+        return standardize_columns(_read_table(path, f.read()))
+
+
+def _local_source():
+    """
+    Path of the freshest local copy of the risk data:
+    the parquet sidecar if it is at least as new as the
+    Excel file, else the Excel file (None if neither
+    exists).
+    """
+    if os.path.exists(SIDECAR_FILE) and (
+        not os.path.exists(EXCEL_FILE)
+        or os.path.getmtime(SIDECAR_FILE) >= os.path.getmtime(EXCEL_FILE)
+    ):
+        return SIDECAR_FILE
+
+    if os.path.exists(EXCEL_FILE):
+        return EXCEL_FILE
+
+    return None
 
 
 # ---------------------------------------
@@ -111,26 +483,33 @@ def load_data(uploaded_file=None):
 
     Also updates Streamlit session_state
     with data source information.
+
+    Parsing and standardization are cached (see
+    _read_uploaded / _read_local), so reruns
+    return the memoized frame. Once a file has been
+    uploaded, later calls without one return that
+    session frame instead of the local data.
     """
 
+    # Uploaded data stays active for the rest of the session
+    if uploaded_file is None and st.session_state.get('data_source') == 'uploaded':
+        cached = st.session_state.get('uploaded_df')
+        if cached is not None:
+            return cached
+
     # Case 1: User uploads a file
     if uploaded_file:
         try:
-            # Determine file type and read accordingly
-            if uploaded_file.name.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(uploaded_file)
-            else:
-                df = pd.read_csv(uploaded_file)
-            
-            # Validate uploaded file columns
-            is_valid, mapping, errors = validate_columns(df)
+            # Parse + standardize (cached per upload)
+            df, errors = _read_uploaded(
+                uploaded_file.file_id,
+                uploaded_file.name,
+                uploaded_file.getvalue()
+            )
 
             # Warn user if required columns are missing
-            if not is_valid:
+            if errors:
                 st.warning(f"⚠️ Missing columns: {', '.join(errors)}")
-            
-            # Standardize columns to app schema
-            df = standardize_columns(df, mapping)
 
             # Save uploaded data to session
             st.session_state.uploaded_df = df
@@ -146,32 +525,156 @@ def load_data(uploaded_file=None):
 
     # Case 2: Load local Excel file
     else:
+        # A read failed less than LOAD_RETRY_DELAY seconds ago
+        # (e.g. file locked during a save): don't retry on
+        # every rerun
+        failed_at = st.session_state.get('_load_failed_at')
+        if failed_at is not None and time.monotonic() - failed_at < LOAD_RETRY_DELAY:
+            return pd.DataFrame(columns=ALL_STANDARD_COLUMNS)
+
         try:
-            if os.path.exists(EXCEL_FILE):
-                df = pd.read_excel(EXCEL_FILE)
+            source = _local_source()
 
-                # Normalize columns to standard format
-                df = standardize_columns(df)
+            if source:
+                # Cached until the file on disk changes
+                stat = os.stat(source)
+                df = _read_local(source, stat.st_mtime_ns, stat.st_size)
 
                 st.session_state.data_source = "local"
+                st.session_state.pop('_load_failed_at', None)
                 return df
             else:
                 # No local file → return empty structured DataFrame
                 return pd.DataFrame(columns=ALL_STANDARD_COLUMNS)
 
-        except:
-            # Safe fallback on read failure
+        except (FileNotFoundError, PermissionError, ValueError) as e:
+            # Missing / locked / unreadable file: record the error,
+            # report each distinct one once, fall back to empty data
+            st.session_state['_load_failed_at'] = time.monotonic()
+
+            errors = st.session_state.setdefault('_load_errors', [])
+            if repr(e) not in errors:
+                errors.append(repr(e))
+                st.warning(f"⚠️ Could not read local data: {e}")
+
             return pd.DataFrame(columns=ALL_STANDARD_COLUMNS)
 
 
 # ---------------------------------------
 # Save data to local Excel file
 # ---------------------------------------
+def _write_atomic(df, path, write):
+    """
+    Writes df to path via a temp file in the same
+    directory + os.replace, so readers never see a
+    partially written file.
+    """
+    # Unique per writer thread; keeps the extension so
+    # pandas still picks the right engine
+    root, ext = os.path.splitext(path)
+    tmp_path = f"{root}.{os.getpid()}-{threading.get_ident()}.tmp{ext}"
+    try:
+        write(df, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_excel(df):
+    """
+    Writes df to EXCEL_FILE as plain values:
+    categoricals back to object, dates as
+    DD-MMM-YY strings.
+    """
+    df = df.astype({col: object for col in CATEGORY_OPTIONS})
+    _write_atomic(
+        format_dates(df), EXCEL_FILE,
+        lambda frame, path: frame.to_excel(path, index=False)
+    )
+
+
+logger = logging.getLogger(__name__)
+
+
+# Background Excel export: one writer at a time, and only
+# the most recent save is written. _export_state guards the
+# sequence number and the last export error (reported by
+# the next save_data call).
+_export_lock = threading.Lock()
+_export_state = threading.Lock()
+_export_seq = 0
+_export_error = None
+
+
+def _next_export_seq():
+    """
+    Claims the next export sequence number; background
+    exports started with an older one skip their write.
+    """
+    global _export_seq
+
+    with _export_state:
+        _export_seq += 1
+        return _export_seq
+
+
+def _export_excel(df, seq):
+    """
+    Background job: writes df to EXCEL_FILE unless a newer
+    save has been queued in the meantime.
+
+    The Excel file gets the sidecar's mtime (if there is
+    one), so it never looks newer than the sidecar and
+    load_data() keeps reading the parquet.
+
+    Failures are logged and kept in _export_error
+    (no UI from a background thread).
+    """
+    global _export_error
+
+    with _export_lock:
+        if seq != _export_seq:
+            return
+        try:
+            _write_excel(df)
+            if os.path.exists(SIDECAR_FILE):
+                sidecar = os.stat(SIDECAR_FILE)
+                os.utime(
+                    EXCEL_FILE,
+                    ns=(sidecar.st_atime_ns, sidecar.st_mtime_ns)
+                )
+        except Exception as e:
+            logger.exception("Excel export to %s failed", EXCEL_FILE)
+            with _export_state:
+                _export_error = f"{type(e).__name__}: {e}"
+
+
 def save_data(df):
     """
-    Saves standardized risk data to local Excel file.
+    Saves standardized risk data locally:
+    - parquet sidecar (native dtypes), written
+      atomically before returning; load_data()
+      reads it instead of the Excel file
+    - Excel file (DD-MMM-YY date strings), exported
+      on a background thread unless
+      st.session_state.export_xlsx is False
     Creates directories if they do not exist.
+
+    A failed background export is reported (st.warning)
+    by the next call.
     """
+    global _export_error
+
+    # Failure of the previous background export, if any
+    with _export_state:
+        export_error, _export_error = _export_error, None
+
+    if export_error:
+        st.warning(
+            f"⚠️ Last Excel export failed ({export_error}); "
+            f"the Excel file may be out of date."
+        )
 
     try:
         # Ensure DataFrame matches standard schema
@@ -180,8 +683,36 @@ def save_data(df):
         # Create parent directory if missing
         os.makedirs(os.path.dirname(EXCEL_FILE), exist_ok=True)
 
-        # Save to Excel
-        df.to_excel(EXCEL_FILE, index=False)
+        try:
+            _write_atomic(
+                df, SIDECAR_FILE,
+                lambda frame, path: frame.to_parquet(path, index=False)
+            )
+        except Exception:
+            # Missing pyarrow / mixed-type column: drop the stale
+            # sidecar and write the Excel file in the foreground,
+            # so the data is on disk before reporting success.
+            # Serialised with the background exports: queued ones
+            # skip (newer seq), a running one finishes first.
+            _next_export_seq()
+            with _export_lock:
+                if os.path.exists(SIDECAR_FILE):
+                    os.remove(SIDECAR_FILE)
+                _write_excel(df)
+        else:
+            # openpyxl writes cell by cell; keep it off the
+            # script thread (df is a fresh standardized frame,
+            # so the job doesn't share it with the UI)
+            if st.session_state.get('export_xlsx', True):
+                threading.Thread(
+                    target=_export_excel,
+                    args=(df, _next_export_seq()),
+                    name="excel-export",
+                    daemon=True
+                ).start()
+
+        # Drop cached reads so the next load sees the new file
+        _read_local.clear()
 
         st.success("💾 Data saved!")
 
@@ -1,9 +1,72 @@
  
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+
+def frame_key(df):
+    """
+    Cheap, order-sensitive cache key for a DataFrame
+    (used as hash_funcs for st.cache_data).
+    """
+    return (
+        len(df),
+        tuple(df.columns),
+        pd.util.hash_pandas_object(df, index=False).values.tobytes()
+    )
+
+
+def _technical_mask(risk_type):
+    """
+    Boolean ndarray: rows whose Risk Type is Technical.
+
+    Categorical columns (as loaded by load_data) compare
+    their int8 codes; anything else compares the raw values.
+    """
+    if isinstance(risk_type.dtype, pd.CategoricalDtype):
+        categories = risk_type.cat.categories
+        if 'Technical' not in categories:
+            return np.zeros(len(risk_type), dtype=bool)
+        return risk_type.cat.codes.values == categories.get_loc('Technical')
+
+    return risk_type.values == 'Technical'
+
+
 def filter_by_user_type(df):
+    """
+    Rows of df the current user may see
+    (tech users: Technical risks only).
+
+    No copy is made for non-tech users: treat the
+    result as read-only and copy at the mutation
+    site if needed.
+    """
     user_type = st.session_state.get('user_type', 'business')  # safe default
+
+    # Non-tech users see everything: df itself.
+    # Tech users: positions of the Technical rows
     if user_type == 'tech':
-        return df[df['Risk Type'] == 'Technical'].copy()
-    return df.copy()
\ No newline at end of file
+        return df.iloc[np.flatnonzero(_technical_mask(df['Risk Type']))]
+
+    return df
+
+
+def preview_dataframe(df, key, default_rows=50):
+    """
+    Renders only the first rows of df; a slider lets the
+    user expand the preview (up to 500 rows), so only the
+    visible projection is sent to the browser.
+    """
+    rows = len(df)
+
+    if rows > 10:
+        max_rows = min(500, rows)
+        rows = st.slider(
+            "Rows to preview",
+            10,
+            max_rows,
+            min(default_rows, max_rows),
+            key=key
+        )
+
+    st.dataframe(df.head(rows), width="stretch")